@@ -1,8 +1,68 @@
 #!/usr/bin/env python3
+import bisect
 import json
+import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_index(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_index(data):
+    # Both paths emit identical bytes: 2-space indent, sorted keys, trailing newline
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + "\n").encode()
+
+
+@contextmanager
+def index_lock(index_path):
+    # Serializes concurrent runs on one machine via a sidecar file, so the index itself is only
+    # ever replaced. CI publishes run on separate runners; the workflow retries those pushes.
+    with open(index_path.with_suffix(".lock"), "a+b") as lf:
+        if fcntl is not None:
+            fcntl.flock(lf, fcntl.LOCK_EX)
+        else:
+            lf.seek(0)
+            msvcrt.locking(lf.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lf, fcntl.LOCK_UN)
+            else:
+                lf.seek(0)
+                msvcrt.locking(lf.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def write_atomic(path, payload):
+    # Readers see either the old or the new index, never a partially written one
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
 index_path = Path(sys.argv[1])
 pkg_id = sys.argv[2]
 version = sys.argv[3]
@@ -11,31 +71,29 @@ manifest_url = sys.argv[5]
 bundle_url = sys.argv[6]
 signature_url = sys.argv[7]
 
-if index_path.exists():
-    data = json.loads(index_path.read_text())
-else:
-    data = {"packages": []}
-
-entry = None
-for pkg in data["packages"]:
-    if pkg["id"] == pkg_id:
-        entry = pkg
-        break
-if entry is None:
-    entry = {"id": pkg_id, "versions": []}
-    data["packages"].append(entry)
-
-entry["versions"] = [v for v in entry["versions"] if v["version"] != version]
-entry["versions"].append({
-    "version": version,
-    "sha256": sha256,
-    "manifest_url": manifest_url,
-    "bundle_url": bundle_url,
-    "signature_url": signature_url,
-    "signature_key_id": "marketplace",
-    "risk_level": "medium",
-    "tier_required": "free"
-})
-entry["versions"].sort(key=lambda x: x["version"])
-data["packages"].sort(key=lambda x: x["id"])
-index_path.write_text(json.dumps(data, indent=2) + "\n")
+with index_lock(index_path):
+    if index_path.exists():
+        data = load_index(index_path.read_bytes())
+    else:
+        data = {"packages": []}
+
+    packages = data["packages"]
+    entry = next((pkg for pkg in packages if pkg["id"] == pkg_id), None)
+    if entry is None:
+        entry = {"id": pkg_id, "versions": []}
+        # Sorted keys don't order lists; packages is kept sorted by id, so insert in place
+        packages.insert(bisect.bisect_left([pkg["id"] for pkg in packages], pkg_id), entry)
+
+    versions_map = {v["version"]: v for v in entry["versions"]}
+    versions_map[version] = {
+        "version": version,
+        "sha256": sha256,
+        "manifest_url": manifest_url,
+        "bundle_url": bundle_url,
+        "signature_url": signature_url,
+        "signature_key_id": "marketplace",
+        "risk_level": "medium",
+        "tier_required": "free"
+    }
+    entry["versions"] = [versions_map[k] for k in sorted(versions_map)]
+    write_atomic(index_path, dump_index(data))
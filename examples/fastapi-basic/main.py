@@ -23,7 +23,7 @@ from typing import Any, Optional
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
-from reach_sdk import create_client
+from reach_sdk import create_async_client
 from reach_sdk.exceptions import ReachError
 
 app = FastAPI(
@@ -32,8 +32,8 @@ app = FastAPI(
     version="1.0.0",
 )
 
-# Create Reach client
-reach = create_client(
+# Create async Reach client so outbound calls don't block the event loop
+reach = create_async_client(
     base_url=os.getenv("REACH_BASE_URL", "http://127.0.0.1:8787")
 )
 
@@ -58,7 +58,7 @@ class HealthResponse(BaseModel):
 async def health():
     """Check server health"""
     try:
-        reach_health = reach.health()
+        reach_health = await reach.health()
         return {"status": "ok", "reach": reach_health}
     except ReachError:
         raise HTTPException(
@@ -71,7 +71,7 @@ async def health():
 async def create_run(request: CreateRunRequest):
     """Create a new run"""
     try:
-        return reach.create_run(
+        return await reach.create_run(
             capabilities=request.capabilities,
             plan_tier=request.plan_tier
         )
@@ -83,7 +83,7 @@ async def create_run(request: CreateRunRequest):
 async def get_run(run_id: str):
     """Get run details"""
     try:
-        return reach.get_run(run_id)
+        return await reach.get_run(run_id)
     except ReachError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -92,7 +92,7 @@ async def get_run(run_id: str):
 async def get_run_events(run_id: str, after: Optional[int] = None):
     """Get run events"""
     try:
-        return reach.get_run_events(run_id, after)
+        return await reach.get_run_events(run_id, after)
     except ReachError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -101,7 +101,7 @@ async def get_run_events(run_id: str, after: Optional[int] = None):
 async def replay_run(run_id: str):
     """Replay a run"""
     try:
-        return reach.replay_run(run_id)
+        return await reach.replay_run(run_id)
     except ReachError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -110,7 +110,7 @@ async def replay_run(run_id: str):
 async def create_capsule(request: CreateCapsuleRequest):
     """Create a capsule from a run"""
     try:
-        return reach.create_capsule(request.run_id)
+        return await reach.create_capsule(request.run_id)
     except ReachError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -119,7 +119,7 @@ async def create_capsule(request: CreateCapsuleRequest):
 async def search_packs(q: Optional[str] = None):
     """Search packs in the registry"""
     try:
-        return reach.search_packs(query=q)
+        return await reach.search_packs(query=q)
     except ReachError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -128,7 +128,7 @@ async def search_packs(q: Optional[str] = None):
 async def federation_status():
     """Get federation status"""
     try:
-        return reach.get_federation_status()
+        return await reach.get_federation_status()
     except ReachError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -136,7 +136,7 @@ async def federation_status():
 @app.on_event("shutdown")
 async def shutdown():
     """Cleanup on shutdown"""
-    reach.close()
+    await reach.aclose()
 
 
 if __name__ == "__main__":
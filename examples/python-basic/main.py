@@ -3,6 +3,12 @@ Reach Python SDK Basic Example
 
 This example demonstrates basic usage of the Reach Python SDK.
 
+Independent requests are fanned out with AsyncReachClient.gather(), so the
+example waits for the slowest call rather than the sum of all of them. Against
+an https:// server with HTTP/2 enabled (pip install "reach-sdk[http2]") the
+concurrent requests share one connection; over plain http:// each concurrent
+request uses its own pooled HTTP/1.1 connection.
+
 Prerequisites:
     1. Reach server running on http://127.0.0.1:8787
        Start with: reach serve
@@ -13,70 +19,55 @@ Usage:
     python main.py
 """
 
-from reach_sdk import create_client
+import asyncio
+
+from reach_sdk import create_async_client
 from reach_sdk.exceptions import ReachError
 
 
-def main():
+async def main():
     print("=== Reach Python SDK Example ===\n")
 
     # Create client
-    client = create_client(base_url="http://127.0.0.1:8787")
+    client = create_async_client(base_url="http://127.0.0.1:8787")
 
     try:
-        # 1. Check server health
-        print("1. Checking server health...")
-        health = client.health()
+        # 1. Fetch server health, API version, packs and federation status together
+        print("1. Fetching server info (health, version, packs, federation)...")
+        health, version, packs, federation = await client.gather(
+            client.health(),
+            client.version(),
+            client.search_packs(query="demo"),
+            client.get_federation_status(),
+        )
         print(f"   Status: {health['status']}")
-        print(f"   Version: {health['version']}\n")
-
-        # 2. Get API version info
-        print("2. Getting API version...")
-        version = client.version()
+        print(f"   Version: {health['version']}")
         print(f"   API Version: {version['apiVersion']}")
-        print(f"   Spec Version: {version['specVersion']}\n")
+        print(f"   Spec Version: {version['specVersion']}")
+        print(f"   Found {len(packs)} pack(s):")
+        for pack in packs:
+            print(f"   - {pack['name']} (verified: {pack['verified']})")
+        print(f"   Federation nodes: {len(federation)}\n")
 
-        # 3. Create a new run
-        print("3. Creating a new run...")
-        run = client.create_run(
+        # 2. Create a new run and fetch its first events in one round trip
+        print("2. Creating a new run and watching its events...")
+        run, events = await client.create_and_watch(
             capabilities=["tool.read", "tool.write"],
             plan_tier="free",
         )
         print(f"   Run ID: {run['id']}")
-        print(f"   Status: {run['status']}\n")
-
-        # 4. Get run details
-        print("4. Getting run details...")
-        run_details = client.get_run(run["id"])
-        print(f"   Run ID: {run_details['id']}")
-        print(f"   Created: {run_details['created_at']}\n")
-
-        # 5. Get run events
-        print("5. Getting run events...")
-        events = client.get_run_events(run["id"])
+        print(f"   Status: {run['status']}")
+        print(f"   Created: {run['created_at']}")
         print(f"   Events count: {len(events)}\n")
 
-        # 6. Search packs
-        print("6. Searching packs...")
-        packs = client.search_packs(query="demo")
-        print(f"   Found {len(packs)} pack(s):")
-        for pack in packs:
-            print(f"   - {pack['name']} (verified: {pack['verified']})")
-        print()
-
-        # 7. Get federation status
-        print("7. Getting federation status...")
-        federation = client.get_federation_status()
-        print(f"   Nodes: {len(federation)}\n")
-
         print("=== Example completed successfully ===")
 
     except ReachError as e:
         print(f"Error: {e}")
         raise
     finally:
-        client.close()
+        await client.aclose()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -2,9 +2,14 @@
 Reach SDK - Python client for deterministic execution fabric
 """
 
+from reach_sdk.async_client import AsyncReachClient, create_async_client
 from reach_sdk.client import ReachClient, create_client
 from reach_sdk.exceptions import ReachError, ReachAPIError, ReachTimeoutError
 from reach_sdk.types import (
+    NODE_STATUSES,
+    REPRO_GRADES,
+    RUN_STATUSES,
+    TERMINAL_RUN_STATUSES,
     Run,
     Event,
     Capsule,
@@ -19,6 +24,8 @@ __version__ = "1.0.0"
 __all__ = [
     "ReachClient",
     "create_client",
+    "AsyncReachClient",
+    "create_async_client",
     "ReachError",
     "ReachAPIError",
     "ReachTimeoutError",
@@ -30,4 +37,8 @@ __all__ = [
     "FederationNode",
     "VerificationResult",
     "ReachClientConfig",
+    "RUN_STATUSES",
+    "TERMINAL_RUN_STATUSES",
+    "NODE_STATUSES",
+    "REPRO_GRADES",
 ]
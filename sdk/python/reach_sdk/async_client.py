@@ -0,0 +1,417 @@
+"""
+Async Reach API client implementation
+"""
+
+import asyncio
+import weakref
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from urllib.parse import quote
+
+import httpx
+
+from reach_sdk.base import (
+    SEARCH_TTL,
+    SYSTEM_TTL,
+    TERMINAL_RUN_TTL,
+    BaseReachClient,
+    envelope_items,
+    logger,
+    run_body,
+    transport_errors,
+)
+from reach_sdk.codec import feed_sse
+from reach_sdk.exceptions import ReachAPIError
+from reach_sdk.types import (
+    TERMINAL_RUN_STATUSES,
+    Event,
+    FederationNode,
+    Pack,
+    Run,
+    VerificationResult,
+)
+
+# Strong references to cleanup tasks so they aren't collected before finishing
+_pending_closes: "Set[asyncio.Task[None]]" = set()
+
+
+def _close_leaked(client: httpx.AsyncClient) -> None:
+    """Finalizer for an AsyncReachClient that was garbage collected without aclose()"""
+    logger.warning("AsyncReachClient was not closed; closing its connection pool on cleanup")
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop left to run aclose() on; the pool's sockets are reclaimed with it
+        return
+    task = loop.create_task(client.aclose())
+    _pending_closes.add(task)
+    task.add_done_callback(_pending_closes.discard)
+
+
+class AsyncReachClient(BaseReachClient):
+    """
+    Asynchronous client for interacting with the Reach API.
+
+    Mirrors ReachClient, but every endpoint is a coroutine so it can be
+    awaited from asyncio applications (e.g. FastAPI) without blocking the loop.
+
+    Args:
+        base_url: The base URL for the Reach API. Defaults to http://127.0.0.1:8787
+        timeout: Request timeout in seconds. Defaults to 30
+        cache_size: Maximum number of cached idempotent GET responses. 0 disables
+            caching. Defaults to 512
+        use_structs: Decode runs, events, packs, federation nodes and verification
+            results into msgspec structs (reach_sdk.models) instead of dicts.
+            Requires msgspec. Defaults to False
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:8787",
+        timeout: float = 30.0,
+        cache_size: int = 512,
+        use_structs: bool = False,
+    ):
+        super().__init__(base_url, timeout, cache_size, use_structs)
+        self._client = httpx.AsyncClient(**self._client_options())
+        # Must not reference self, or the client would never be collected
+        self._finalizer = weakref.finalize(self, _close_leaked, self._client)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        cache_key: Optional[Hashable] = None,
+        cache_ttl: float = 0.0,
+        cache_if: Optional[Callable[[Any], bool]] = None,
+        decode_as: Optional[str] = None,
+    ) -> Any:
+        """
+        Make an HTTP request to the API
+
+        When cache_key is given, a fresh cached body is returned without touching
+        the network, and a successful response is cached for cache_ttl seconds
+        unless the server sends Cache-Control: no-store or cache_if rejects it.
+        decode_as names the struct decoder to use when use_structs is enabled.
+        """
+        parse = self._parser(decode_as)
+        if cache_key is not None:
+            cached = self._cached(cache_key, parse)
+            if cached is not None:
+                return cached
+
+        content, headers = self._encode(json_data, headers)
+        with transport_errors():
+            response = await self._client.request(
+                method=method,
+                url=path,
+                content=content,
+                params=params,
+                headers=headers,
+            )
+        return self._handle_response(response, parse, cache_key, cache_ttl, cache_if)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client"""
+        self._finalizer.detach()
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncReachClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def gather(self, *requests: Awaitable[Any]) -> List[Any]:
+        """
+        Run independent requests concurrently
+
+        Requests without data dependencies should be fanned out rather than
+        awaited one by one. Against https:// servers with HTTP/2 they share a
+        single connection; over plain http:// each uses a pooled HTTP/1.1 connection.
+
+        Args:
+            requests: Awaitables returned by this client's endpoint methods
+
+        Returns:
+            Results in the same order as the requests
+        """
+        return list(await asyncio.gather(*requests))
+
+    # System endpoints
+    async def health(self) -> Dict[str, str]:
+        """Check the health of the Reach server"""
+        return await self._request(
+            "GET", "/health", cache_key=("GET", "/health"), cache_ttl=SYSTEM_TTL
+        )
+
+    async def version(self) -> Dict[str, Any]:
+        """Get API version information"""
+        return await self._request(
+            "GET", "/version", cache_key=("GET", "/version"), cache_ttl=SYSTEM_TTL
+        )
+
+    # Run endpoints
+    async def create_run(
+        self,
+        capabilities: Optional[List[str]] = None,
+        plan_tier: Optional[str] = None,
+        **fields: Any,
+    ) -> Run:
+        """
+        Create a new run
+
+        Args:
+            capabilities: List of capabilities required for the run
+            plan_tier: Plan tier (free, pro, enterprise)
+            **fields: Additional run fields, forwarded to the API as-is
+
+        Returns:
+            The created run
+        """
+        body = run_body(capabilities, plan_tier, fields)
+        return await self._request("POST", "/runs", body, decode_as="run")
+
+    async def create_and_watch(
+        self,
+        *,
+        capabilities: Optional[List[str]] = None,
+        plan_tier: Optional[str] = None,
+        initial_events: int = 50,
+        **fields: Any,
+    ) -> Tuple[Run, List[Event]]:
+        """
+        Create a new run and fetch its first events
+
+        Servers that support it return the run with up to initial_events events
+        inlined from a single POST /runs?include=events. Otherwise the run from
+        the create response is returned with the first initial_events events from
+        get_run_events. Support is detected on first use and remembered per base URL.
+
+        Args:
+            capabilities: List of capabilities required for the run
+            plan_tier: Plan tier (free, pro, enterprise)
+            initial_events: Maximum number of events to return with the run
+            **fields: Additional run fields, forwarded to the API as-is
+
+        Returns:
+            The run and its first events
+        """
+        body = run_body(capabilities, plan_tier, fields)
+
+        run = None
+        options = self._fused_create_options(initial_events)
+        if options is not None:
+            try:
+                run = await self._request("POST", "/runs", body, **options)
+            except ReachAPIError as e:
+                if e.status_code != 400:
+                    raise
+        fused = run is not None
+        if not fused:
+            run = await self._request("POST", "/runs", body, decode_as="run")
+
+        run, events = self._fused_create_outcome(run, fused)
+        if events is None:
+            # The run already exists; only its first events are still missing
+            events = (await self.get_run_events(run["id"]))[:initial_events]
+        return run, events
+
+    async def get_run(self, run_id: str) -> Run:
+        """
+        Get a run by ID
+
+        Args:
+            run_id: The run ID
+
+        Returns:
+            The run
+        """
+        path = f"/runs/{quote(run_id, safe='')}"
+        # Terminal runs never change again, so they can be cached for much longer
+        return await self._request(
+            "GET",
+            path,
+            cache_key=("GET", path),
+            cache_ttl=TERMINAL_RUN_TTL,
+            cache_if=lambda run: run.get("status") in TERMINAL_RUN_STATUSES,
+            decode_as="run",
+        )
+
+    async def get_run_events(self, run_id: str, after: Optional[int] = None) -> List[Event]:
+        """
+        Get events for a run
+
+        Args:
+            run_id: The run ID
+            after: Event ID to start from
+
+        Returns:
+            List of events
+        """
+        result = await self._request(
+            "GET",
+            f"/runs/{quote(run_id, safe='')}/events",
+            params={"after": after} if after is not None else None,
+            decode_as="events",
+        )
+        return envelope_items(result, "events")
+
+    async def stream_run_events(self, run_id: str) -> AsyncIterator[Event]:
+        """
+        Stream events for a run using Server-Sent Events
+
+        Args:
+            run_id: The run ID
+
+        Yields:
+            Events as they arrive
+        """
+        async with self._client.stream(
+            "GET",
+            f"/runs/{quote(run_id, safe='')}/events",
+            headers={"Accept": "text/event-stream"},
+            # Streams stay open between events, so only bound connection setup
+            timeout=httpx.Timeout(self.timeout, read=None),
+        ) as response:
+            response.raise_for_status()
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes():
+                for event in feed_sse(buffer, chunk, self._event_loads):
+                    yield event
+
+    async def replay_run(self, run_id: str) -> Dict[str, Any]:
+        """
+        Replay a run
+
+        Args:
+            run_id: The run ID to replay
+
+        Returns:
+            Replay result with verification status
+        """
+        return await self._request("POST", f"/runs/{quote(run_id, safe='')}/replay")
+
+    # Capsule endpoints
+    async def create_capsule(self, run_id: str) -> Dict[str, Any]:
+        """
+        Create a capsule from a run
+
+        Args:
+            run_id: The run ID to create a capsule from
+
+        Returns:
+            The created capsule
+        """
+        return await self._request("POST", "/capsules", {"run_id": run_id})
+
+    async def verify_capsule(self, path: str) -> VerificationResult:
+        """
+        Verify a capsule
+
+        Args:
+            path: Path to the capsule file
+
+        Returns:
+            Verification result
+        """
+        return await self._request(
+            "POST", "/capsules/verify", {"path": path}, decode_as="verification"
+        )
+
+    # Federation endpoints
+    async def get_federation_status(self) -> List[FederationNode]:
+        """
+        Get federation status
+
+        Returns:
+            List of federation nodes
+        """
+        result = await self._request("GET", "/federation/status", decode_as="federation")
+        return envelope_items(result, "nodes")
+
+    # Pack endpoints
+    async def search_packs(self, query: Optional[str] = None) -> List[Pack]:
+        """
+        Search for packs in the registry
+
+        Args:
+            query: Search query string
+
+        Returns:
+            List of matching packs
+        """
+        result = await self._request(
+            "GET",
+            "/packs",
+            params={"q": query} if query else None,
+            cache_key=("GET", "/packs", query),
+            cache_ttl=SEARCH_TTL,
+            decode_as="packs",
+        )
+        return envelope_items(result, "results")
+
+    async def install_pack(self, name: str) -> Dict[str, Any]:
+        """
+        Install a pack from the registry
+
+        Args:
+            name: Name of the pack to install
+
+        Returns:
+            Installation result
+        """
+        return await self._request("POST", "/packs/install", {"name": name})
+
+    async def verify_pack(self, name: str) -> VerificationResult:
+        """
+        Verify a pack
+
+        Args:
+            name: Name of the pack to verify
+
+        Returns:
+            Verification result
+        """
+        return await self._request(
+            "POST", "/packs/verify", {"name": name}, decode_as="verification"
+        )
+
+
+def create_async_client(
+    base_url: str = "http://127.0.0.1:8787",
+    timeout: float = 30.0,
+    cache_size: int = 512,
+    use_structs: bool = False,
+) -> AsyncReachClient:
+    """
+    Create a new async Reach client
+
+    Args:
+        base_url: The base URL for the Reach API
+        timeout: Request timeout in seconds
+        cache_size: Maximum number of cached idempotent GET responses (0 disables)
+        use_structs: Decode responses into reach_sdk.models structs (requires msgspec)
+
+    Returns:
+        A new AsyncReachClient instance
+    """
+    return AsyncReachClient(
+        base_url=base_url,
+        timeout=timeout,
+        cache_size=cache_size,
+        use_structs=use_structs,
+    )
@@ -0,0 +1,177 @@
+"""
+Request handling shared by ReachClient and AsyncReachClient
+
+Everything except the transport call lives here: cache lookup, body encoding,
+transport error mapping, response decoding and cache storage. The clients only
+differ in whether they call httpx.Client or httpx.AsyncClient.
+"""
+
+import logging
+from contextlib import contextmanager
+from importlib.util import find_spec
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import httpx
+
+from reach_sdk.cache import ResponseCache, is_storable
+from reach_sdk.codec import JSON_CONTENT_TYPE, api_error, encode_body, loads, parse_body
+from reach_sdk.exceptions import ReachError, ReachNetworkError, ReachTimeoutError
+
+logger = logging.getLogger("reach_sdk")
+
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+HTTP2 = find_spec("h2") is not None
+
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
+# Cache lifetimes (seconds) for idempotent GETs
+SYSTEM_TTL = 2.0
+SEARCH_TTL = 5.0
+TERMINAL_RUN_TTL = 300.0
+
+# Whether a base URL supports returning a new run with its first events inlined
+# (POST /runs?include=events). Detected on first use and shared by all clients.
+FUSED_CREATE_SUPPORT: Dict[str, bool] = {}
+FUSED_CREATE_PARAMS = {"include": "events"}
+FUSED_CREATE_PREFER = {"Prefer": "return=representation, wait=2"}
+
+
+def split_inline_events(run: Any) -> Tuple[Any, Optional[List[Any]]]:
+    """Separate the events array a server inlined into a run representation"""
+    if isinstance(run, dict):
+        return run, run.pop("events", None)
+    # use_structs: a models.RunWithEvents, split into a plain models.Run
+    split: Tuple[Any, Optional[List[Any]]] = run.split()
+    return split
+
+
+def envelope_items(result: Any, key: str) -> List[Any]:
+    """Unwrap the list an envelope endpoint returns under key"""
+    if result is None:
+        # A 2xx without a body (e.g. 204) carries no envelope to unwrap
+        raise ReachError(f"Empty response body, expected {key!r}", code="INVALID_RESPONSE")
+    items: List[Any] = result.get(key, [])
+    return items
+
+
+def run_body(
+    capabilities: Optional[List[str]], plan_tier: Optional[str], fields: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build a POST /runs body from create_run style arguments"""
+    # None means "not set", so unset fields are left out of the request body
+    fields.update(capabilities=capabilities, plan_tier=plan_tier)
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+@contextmanager
+def transport_errors() -> Iterator[None]:
+    """Map httpx transport failures onto the SDK's exceptions"""
+    try:
+        yield
+    except httpx.TimeoutException as e:
+        raise ReachTimeoutError(str(e)) from e
+    except httpx.TransportError as e:
+        raise ReachNetworkError(str(e)) from e
+
+
+class BaseReachClient:
+    """
+    State and request steps shared by the sync and async clients
+
+    Args:
+        base_url: The base URL for the Reach API
+        timeout: Request timeout in seconds
+        cache_size: Maximum number of cached idempotent GET responses. 0 disables caching
+        use_structs: Decode responses into reach_sdk.models structs (requires msgspec)
+    """
+
+    def __init__(self, base_url: str, timeout: float, cache_size: int, use_structs: bool):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._cache = ResponseCache(maxsize=cache_size)
+        self._decoders: Dict[str, Callable[[bytes], Any]] = {}
+        if use_structs:
+            from reach_sdk.models import DECODERS
+
+            self._decoders = DECODERS
+        self._event_loads = self._decoders.get("event", loads)
+
+    def _client_options(self) -> Dict[str, Any]:
+        """Keyword arguments for the underlying httpx client"""
+        return {
+            "base_url": self.base_url,
+            "timeout": httpx.Timeout(self.timeout),
+            "headers": {"Accept": "application/json"},
+            "http2": HTTP2,
+            "limits": POOL_LIMITS,
+        }
+
+    def _parser(self, decode_as: Optional[str]) -> Callable[[Any], Any]:
+        """The decoder for decode_as, or plain JSON when structs are disabled"""
+        return self._decoders.get(decode_as, loads) if decode_as else loads
+
+    def _cached(self, cache_key: Hashable, parse: Callable[[Any], Any]) -> Any:
+        """Decode a fresh cached body for cache_key, or return None on a miss"""
+        cached = self._cache.get(cache_key)
+        return parse_body(parse, cached) if cached is not None else None
+
+    @staticmethod
+    def _encode(
+        json_data: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]
+    ) -> Tuple[Optional[bytes], Optional[Dict[str, str]]]:
+        """Serialize the request body and add its Content-Type header"""
+        if json_data is None:
+            return None, headers
+        content = encode_body(json_data)
+        return content, {**JSON_CONTENT_TYPE, **headers} if headers else JSON_CONTENT_TYPE
+
+    def _fused_create_options(self, initial_events: int) -> Optional[Dict[str, Any]]:
+        """_request options for POST /runs?include=events, or None if the server lacks it"""
+        if not FUSED_CREATE_SUPPORT.get(self.base_url, True):
+            return None
+        return {
+            "headers": FUSED_CREATE_PREFER,
+            "params": {**FUSED_CREATE_PARAMS, "max_events": initial_events},
+            "decode_as": "run_with_events",
+        }
+
+    def _fused_create_outcome(self, run: Any, fused: bool) -> Tuple[Any, Optional[List[Any]]]:
+        """
+        Remember whether this base URL inlines events into a created run
+
+        fused says whether run came from the include=events request. Returns the
+        run and its inlined events, or None when they still have to be fetched.
+        """
+        if not fused:
+            # The plain create succeeded, so the 400 was about include=events
+            FUSED_CREATE_SUPPORT[self.base_url] = False
+            return run, None
+        run, events = split_inline_events(run)
+        FUSED_CREATE_SUPPORT[self.base_url] = events is not None
+        return run, events
+
+    def _handle_response(
+        self,
+        response: httpx.Response,
+        parse: Callable[[Any], Any],
+        cache_key: Optional[Hashable],
+        cache_ttl: float,
+        cache_if: Optional[Callable[[Any], bool]],
+    ) -> Any:
+        """Raise for error statuses, decode the body and cache it when allowed"""
+        if not response.is_success:
+            raise api_error(response)
+        result = parse_body(parse, response.content)
+
+        if (
+            cache_key is not None
+            and result is not None
+            and is_storable(response)
+            and (cache_if is None or cache_if(result))
+        ):
+            self._cache.set(cache_key, response.content, cache_ttl)
+        return result
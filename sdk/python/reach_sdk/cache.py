@@ -0,0 +1,63 @@
+"""
+In-process response cache for idempotent Reach API requests
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import httpx
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of raw response bodies with a per-entry TTL.
+
+    Bodies are stored as bytes and re-parsed on every hit, so callers never
+    share (and accidentally mutate) the same decoded object.
+
+    Args:
+        maxsize: Maximum number of entries kept. 0 disables caching
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return the cached body for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def set(self, key: Hashable, body: bytes, ttl: float) -> None:
+        """Store body under key for ttl seconds, evicting the least recently used entry"""
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def is_storable(response: httpx.Response) -> bool:
+    """Whether the server allows the response to be cached"""
+    return "no-store" not in response.headers.get("Cache-Control", "").lower()
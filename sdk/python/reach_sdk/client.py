@@ -2,12 +2,26 @@
 Reach API client implementation
 """
 
-from typing import Any, Dict, Iterator, List, Optional
+import weakref
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
 
 import httpx
 
-from reach_sdk.exceptions import ReachAPIError, ReachError, ReachNetworkError, ReachTimeoutError
+from reach_sdk.base import (
+    SEARCH_TTL,
+    SYSTEM_TTL,
+    TERMINAL_RUN_TTL,
+    BaseReachClient,
+    envelope_items,
+    logger,
+    run_body,
+    transport_errors,
+)
+from reach_sdk.codec import feed_sse
+from reach_sdk.exceptions import ReachAPIError
 from reach_sdk.types import (
+    TERMINAL_RUN_STATUSES,
     Capsule,
     Event,
     FederationNode,
@@ -17,27 +31,37 @@ from reach_sdk.types import (
 )
 
 
-class ReachClient:
+def _close_leaked(client: httpx.Client) -> None:
+    """Finalizer for a ReachClient that was garbage collected without close()"""
+    logger.warning("ReachClient was not closed; closing its connection pool on cleanup")
+    client.close()
+
+
+class ReachClient(BaseReachClient):
     """
     Client for interacting with the Reach API.
 
     Args:
         base_url: The base URL for the Reach API. Defaults to http://127.0.0.1:8787
         timeout: Request timeout in seconds. Defaults to 30
+        cache_size: Maximum number of cached idempotent GET responses. 0 disables
+            caching. Defaults to 512
+        use_structs: Decode runs, events, packs, federation nodes and verification
+            results into msgspec structs (reach_sdk.models) instead of dicts.
+            Requires msgspec. Defaults to False
     """
 
     def __init__(
         self,
         base_url: str = "http://127.0.0.1:8787",
         timeout: float = 30.0,
+        cache_size: int = 512,
+        use_structs: bool = False,
     ):
-        self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            timeout=httpx.Timeout(timeout),
-            headers={"Accept": "application/json"},
-        )
+        super().__init__(base_url, timeout, cache_size, use_structs)
+        self._client = httpx.Client(**self._client_options())
+        # Must not reference self, or the client would never be collected
+        self._finalizer = weakref.finalize(self, _close_leaked, self._client)
 
     def _request(
         self,
@@ -45,42 +69,40 @@ class ReachClient:
         path: str,
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        cache_key: Optional[Hashable] = None,
+        cache_ttl: float = 0.0,
+        cache_if: Optional[Callable[[Any], bool]] = None,
+        decode_as: Optional[str] = None,
     ) -> Any:
-        """Make an HTTP request to the API"""
-        try:
+        """
+        Make an HTTP request to the API
+
+        When cache_key is given, a fresh cached body is returned without touching
+        the network, and a successful response is cached for cache_ttl seconds
+        unless the server sends Cache-Control: no-store or cache_if rejects it.
+        decode_as names the struct decoder to use when use_structs is enabled.
+        """
+        parse = self._parser(decode_as)
+        if cache_key is not None:
+            cached = self._cached(cache_key, parse)
+            if cached is not None:
+                return cached
+
+        content, headers = self._encode(json_data, headers)
+        with transport_errors():
             response = self._client.request(
                 method=method,
                 url=path,
-                json=json_data,
+                content=content,
+                params=params,
                 headers=headers,
             )
-            response.raise_for_status()
-            return response.json()
-        except httpx.TimeoutException as e:
-            raise ReachTimeoutError(str(e)) from e
-        except httpx.NetworkError as e:
-            raise ReachNetworkError(str(e)) from e
-        except httpx.HTTPStatusError as e:
-            try:
-                error_data = e.response.json()
-                raise ReachAPIError(
-                    message=error_data.get("error", f"HTTP {e.response.status_code}"),
-                    code=error_data.get("code", "UNKNOWN_ERROR"),
-                    status_code=e.response.status_code,
-                    details=error_data.get("details"),
-                    remediation=error_data.get("remediation"),
-                ) from e
-            except (ValueError, AttributeError):
-                raise ReachAPIError(
-                    message=f"HTTP {e.response.status_code}",
-                    code="HTTP_ERROR",
-                    status_code=e.response.status_code,
-                ) from e
-        except Exception as e:
-            raise ReachError(str(e)) from e
+        return self._handle_response(response, parse, cache_key, cache_ttl, cache_if)
 
     def close(self) -> None:
         """Close the HTTP client"""
+        self._finalizer.detach()
         self._client.close()
 
     def __enter__(self) -> "ReachClient":
@@ -92,17 +114,18 @@ class ReachClient:
     # System endpoints
     def health(self) -> Dict[str, str]:
         """Check the health of the Reach server"""
-        return self._request("GET", "/health")
+        return self._request("GET", "/health", cache_key=("GET", "/health"), cache_ttl=SYSTEM_TTL)
 
     def version(self) -> Dict[str, Any]:
         """Get API version information"""
-        return self._request("GET", "/version")
+        return self._request("GET", "/version", cache_key=("GET", "/version"), cache_ttl=SYSTEM_TTL)
 
     # Run endpoints
     def create_run(
         self,
         capabilities: Optional[List[str]] = None,
         plan_tier: Optional[str] = None,
+        **fields: Any,
     ) -> Run:
         """
         Create a new run
@@ -110,17 +133,58 @@ class ReachClient:
         Args:
             capabilities: List of capabilities required for the run
             plan_tier: Plan tier (free, pro, enterprise)
+            **fields: Additional run fields, forwarded to the API as-is
 
         Returns:
             The created run
         """
-        body: Dict[str, Any] = {}
-        if capabilities is not None:
-            body["capabilities"] = capabilities
-        if plan_tier is not None:
-            body["plan_tier"] = plan_tier
+        body = run_body(capabilities, plan_tier, fields)
+        return self._request("POST", "/runs", body, decode_as="run")
+
+    def create_and_watch(
+        self,
+        *,
+        capabilities: Optional[List[str]] = None,
+        plan_tier: Optional[str] = None,
+        initial_events: int = 50,
+        **fields: Any,
+    ) -> Tuple[Run, List[Event]]:
+        """
+        Create a new run and fetch its first events
+
+        Servers that support it return the run with up to initial_events events
+        inlined from a single POST /runs?include=events. Otherwise the run from
+        the create response is returned with the first initial_events events from
+        get_run_events. Support is detected on first use and remembered per base URL.
+
+        Args:
+            capabilities: List of capabilities required for the run
+            plan_tier: Plan tier (free, pro, enterprise)
+            initial_events: Maximum number of events to return with the run
+            **fields: Additional run fields, forwarded to the API as-is
+
+        Returns:
+            The run and its first events
+        """
+        body = run_body(capabilities, plan_tier, fields)
 
-        return self._request("POST", "/runs", body)
+        run = None
+        options = self._fused_create_options(initial_events)
+        if options is not None:
+            try:
+                run = self._request("POST", "/runs", body, **options)
+            except ReachAPIError as e:
+                if e.status_code != 400:
+                    raise
+        fused = run is not None
+        if not fused:
+            run = self._request("POST", "/runs", body, decode_as="run")
+
+        run, events = self._fused_create_outcome(run, fused)
+        if events is None:
+            # The run already exists; only its first events are still missing
+            events = self.get_run_events(run["id"])[:initial_events]
+        return run, events
 
     def get_run(self, run_id: str) -> Run:
         """
@@ -132,7 +196,16 @@ class ReachClient:
         Returns:
             The run
         """
-        return self._request("GET", f"/runs/{run_id}")
+        path = f"/runs/{quote(run_id, safe='')}"
+        # Terminal runs never change again, so they can be cached for much longer
+        return self._request(
+            "GET",
+            path,
+            cache_key=("GET", path),
+            cache_ttl=TERMINAL_RUN_TTL,
+            cache_if=lambda run: run.get("status") in TERMINAL_RUN_STATUSES,
+            decode_as="run",
+        )
 
     def get_run_events(self, run_id: str, after: Optional[int] = None) -> List[Event]:
         """
@@ -145,9 +218,13 @@ class ReachClient:
         Returns:
             List of events
         """
-        params = f"?after={after}" if after is not None else ""
-        result = self._request("GET", f"/runs/{run_id}/events{params}")
-        return result.get("events", [])
+        result = self._request(
+            "GET",
+            f"/runs/{quote(run_id, safe='')}/events",
+            params={"after": after} if after is not None else None,
+            decode_as="events",
+        )
+        return envelope_items(result, "events")
 
     def stream_run_events(self, run_id: str) -> Iterator[Event]:
         """
@@ -159,22 +236,17 @@ class ReachClient:
         Yields:
             Events as they arrive
         """
-        import json
-
-        with httpx.stream(
+        with self._client.stream(
             "GET",
-            f"{self.base_url}/runs/{run_id}/events",
+            f"/runs/{quote(run_id, safe='')}/events",
             headers={"Accept": "text/event-stream"},
-            timeout=self.timeout,
+            # Streams stay open between events, so only bound connection setup
+            timeout=httpx.Timeout(self.timeout, read=None),
         ) as response:
             response.raise_for_status()
-            for line in response.iter_lines():
-                if line.startswith("data: "):
-                    try:
-                        event = json.loads(line[6:])
-                        yield event
-                    except json.JSONDecodeError:
-                        continue
+            buffer = bytearray()
+            for chunk in response.iter_bytes():
+                yield from feed_sse(buffer, chunk, self._event_loads)
 
     def replay_run(self, run_id: str) -> Dict[str, Any]:
         """
@@ -186,7 +258,7 @@ class ReachClient:
         Returns:
             Replay result with verification status
         """
-        return self._request("POST", f"/runs/{run_id}/replay")
+        return self._request("POST", f"/runs/{quote(run_id, safe='')}/replay")
 
     # Capsule endpoints
     def create_capsule(self, run_id: str) -> Dict[str, Any]:
@@ -211,7 +283,7 @@ class ReachClient:
         Returns:
             Verification result
         """
-        return self._request("POST", "/capsules/verify", {"path": path})
+        return self._request("POST", "/capsules/verify", {"path": path}, decode_as="verification")
 
     # Federation endpoints
     def get_federation_status(self) -> List[FederationNode]:
@@ -221,8 +293,8 @@ class ReachClient:
         Returns:
             List of federation nodes
         """
-        result = self._request("GET", "/federation/status")
-        return result.get("nodes", [])
+        result = self._request("GET", "/federation/status", decode_as="federation")
+        return envelope_items(result, "nodes")
 
     # Pack endpoints
     def search_packs(self, query: Optional[str] = None) -> List[Pack]:
@@ -235,9 +307,15 @@ class ReachClient:
         Returns:
             List of matching packs
         """
-        params = f"?q={query}" if query else ""
-        result = self._request("GET", f"/packs{params}")
-        return result.get("results", [])
+        result = self._request(
+            "GET",
+            "/packs",
+            params={"q": query} if query else None,
+            cache_key=("GET", "/packs", query),
+            cache_ttl=SEARCH_TTL,
+            decode_as="packs",
+        )
+        return envelope_items(result, "results")
 
     def install_pack(self, name: str) -> Dict[str, Any]:
         """
@@ -261,12 +339,14 @@ class ReachClient:
         Returns:
             Verification result
         """
-        return self._request("POST", "/packs/verify", {"name": name})
+        return self._request("POST", "/packs/verify", {"name": name}, decode_as="verification")
 
 
 def create_client(
     base_url: str = "http://127.0.0.1:8787",
     timeout: float = 30.0,
+    cache_size: int = 512,
+    use_structs: bool = False,
 ) -> ReachClient:
     """
     Create a new Reach client
@@ -274,8 +354,15 @@ def create_client(
     Args:
         base_url: The base URL for the Reach API
         timeout: Request timeout in seconds
+        cache_size: Maximum number of cached idempotent GET responses (0 disables)
+        use_structs: Decode responses into reach_sdk.models structs (requires msgspec)
 
     Returns:
         A new ReachClient instance
     """
-    return ReachClient(base_url=base_url, timeout=timeout)
+    return ReachClient(
+        base_url=base_url,
+        timeout=timeout,
+        cache_size=cache_size,
+        use_structs=use_structs,
+    )
@@ -0,0 +1,126 @@
+"""
+JSON and Server-Sent Events codec helpers shared by the Reach clients
+
+These run on every request, so they are kept free of client state and fully
+typed; wheels built with the mypyc hook compile this module to C.
+"""
+
+import dataclasses
+import datetime
+import enum
+import json
+import uuid
+from typing import Any, Callable, Dict, Iterator
+
+import httpx
+
+from reach_sdk.exceptions import ReachAPIError, ReachError
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode the non-builtin types orjson serializes natively, the same way orjson does"""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=_json_default
+    ).encode()
+
+
+try:
+    import orjson
+
+    loads: Callable[[Any], Any] = orjson.loads
+    dumps: Callable[[Any], bytes] = orjson.dumps
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    loads = json.loads
+    dumps = _json_dumps
+
+# Bodies are pre-encoded with dumps rather than through httpx's json= (stdlib json.dumps)
+JSON_CONTENT_TYPE: Dict[str, str] = {"Content-Type": "application/json"}
+
+SSE_DATA_PREFIX = b"data: "
+
+
+def encode_body(obj: Any) -> bytes:
+    """
+    Serialize a request body
+
+    Builtin JSON types plus datetime, date, time, UUID, Enum and dataclass
+    values are accepted with or without orjson installed; anything else
+    raises ReachError with code INVALID_REQUEST.
+    """
+    try:
+        return dumps(obj)
+    except (TypeError, ValueError) as e:
+        # orjson.JSONEncodeError subclasses TypeError; json raises ValueError on cycles
+        err = ReachError(f"Invalid request body: {e}", code="INVALID_REQUEST")
+        # Set explicitly: mypyc-compiled code drops the cause of "raise ... from e"
+        err.__cause__ = e
+        raise err from e
+
+
+def feed_sse(
+    buffer: bytearray,
+    chunk: bytes,
+    parse: Callable[[Any], Any] = loads,
+) -> Iterator[Any]:
+    """Append chunk to buffer and yield the decoded payload of each complete data line"""
+    buffer.extend(chunk)
+    while True:
+        nl = buffer.find(b"\n")
+        if nl == -1:
+            return
+        if buffer.startswith(SSE_DATA_PREFIX, 0, nl):
+            payload = buffer[len(SSE_DATA_PREFIX) : nl]
+            del buffer[: nl + 1]
+            try:
+                yield parse(payload)
+            except ValueError:
+                # orjson and msgspec decode errors both subclass ValueError
+                continue
+        else:
+            del buffer[: nl + 1]
+
+
+def parse_body(parse: Callable[[Any], Any], content: bytes) -> Any:
+    """Decode a successful response body; empty bodies decode to None"""
+    if not content:
+        return None
+    try:
+        return parse(content)
+    except ValueError as e:
+        err = ReachError(f"Invalid response body: {e}", code="INVALID_RESPONSE")
+        err.__cause__ = e
+        raise err from e
+
+
+def api_error(response: httpx.Response) -> ReachAPIError:
+    """Build a ReachAPIError from an unsuccessful response, parsing its body once"""
+    status_code = response.status_code
+    try:
+        error_data = loads(response.content) if response.content else None
+    except ValueError:
+        error_data = None
+    if not isinstance(error_data, dict):
+        return ReachAPIError(
+            message=f"HTTP {status_code}",
+            code="HTTP_ERROR",
+            status_code=status_code,
+        )
+    return ReachAPIError(
+        message=error_data.get("error", f"HTTP {status_code}"),
+        code=error_data.get("code", "UNKNOWN_ERROR"),
+        status_code=status_code,
+        details=error_data.get("details"),
+        remediation=error_data.get("remediation"),
+    )
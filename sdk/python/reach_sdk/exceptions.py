@@ -2,12 +2,20 @@
 Exception classes for the Reach SDK
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Type
+
+
+def _rebuild(cls: Type["ReachError"], args: Tuple[Any, ...]) -> "ReachError":
+    """Recreate an exception without calling __init__; __setstate__ restores the fields"""
+    return cls.__new__(cls, *args)
 
 
 class ReachError(Exception):
     """Base exception for Reach SDK errors"""
 
+    # Slots keep the attributes out of the lazily created instance __dict__
+    __slots__ = ("message", "code", "details", "remediation")
+
     def __init__(
         self,
         message: str,
@@ -21,6 +29,21 @@ class ReachError(Exception):
         self.details = details or {}
         self.remediation = remediation
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # BaseException.__reduce__ only carries args and __dict__, which would drop slot values
+        state = dict(self.__dict__)
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return _rebuild, (type(self), self.args), state
+
+    def __setstate__(self, state: Optional[Dict[str, Any]]) -> None:
+        if state is None:
+            return
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __str__(self) -> str:
         parts = [f"[{self.code}] {self.message}"]
         if self.remediation:
@@ -31,6 +54,8 @@ class ReachError(Exception):
 class ReachAPIError(ReachError):
     """Error returned from the Reach API"""
 
+    __slots__ = ("status_code",)
+
     def __init__(
         self,
         message: str,
@@ -46,6 +71,8 @@ class ReachAPIError(ReachError):
 class ReachTimeoutError(ReachError):
     """Request timeout error"""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Request timed out"):
         super().__init__(
             message,
@@ -57,6 +84,8 @@ class ReachTimeoutError(ReachError):
 class ReachNetworkError(ReachError):
     """Network connectivity error"""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Network error"):
         super().__init__(
             message,
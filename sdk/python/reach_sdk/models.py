@@ -0,0 +1,136 @@
+"""
+msgspec-backed models for the Reach SDK
+
+These mirror the TypedDicts in reach_sdk.types but decode straight from JSON
+bytes into compact, schema-validated structs. They are used when a client is
+created with use_structs=True and require the optional msgspec package
+(pip install "reach-sdk[structs]").
+"""
+
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+
+import msgspec
+from msgspec import UNSET, UnsetType
+
+
+class _Model(msgspec.Struct, frozen=True, gc=False):
+    """
+    Base struct that also supports dict-style access for TypedDict users
+
+    Fields left UNSET (keys the server did not send) behave like missing keys,
+    matching the total=False TypedDicts they mirror.
+    """
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, UNSET) if key in self.__struct_fields__ else UNSET
+        if value is UNSET:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__struct_fields__ and getattr(self, key) is not UNSET
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, UNSET) if key in self.__struct_fields__ else UNSET
+        return default if value is UNSET else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the struct into plain builtin types"""
+        return msgspec.to_builtins(self)  # type: ignore[no-any-return]
+
+
+class Run(_Model, frozen=True, gc=False):
+    """A Reach execution run"""
+
+    id: str
+    status: Literal["pending", "running", "completed", "failed", "cancelled"]
+    created_at: str
+    tier: Optional[str] = None
+    capabilities: Optional[List[str]] = None
+    completed_at: Optional[str] = None
+
+
+class Event(_Model, frozen=True, gc=False):
+    """An event in a run's event log"""
+
+    id: int
+    type: str
+    payload: Dict[str, Any]
+    created_at: str
+
+
+class Pack(_Model, frozen=True, gc=False):
+    """An execution pack from the registry"""
+
+    name: str
+    repo: str
+    spec_version: str
+    verified: bool
+    signature: Optional[str] = None
+    reproducibility: Optional[Literal["A", "B", "C", "D", "F"]] = None
+
+
+class FederationNode(_Model, frozen=True, gc=False):
+    """A node in the federation"""
+
+    node_id: Union[str, UnsetType] = UNSET
+    status: Union[Literal["active", "inactive", "quarantined"], UnsetType] = UNSET
+    capabilities: Union[List[str], UnsetType] = UNSET
+    latency_ms: Union[int, UnsetType] = UNSET
+    load_score: Union[int, UnsetType] = UNSET
+    trust_score: Union[float, UnsetType] = UNSET
+    quarantined: Union[bool, UnsetType] = UNSET
+
+
+class VerificationResult(_Model, frozen=True, gc=False):
+    """Result of a verification operation"""
+
+    verified: Union[bool, UnsetType] = UNSET
+    name: Union[str, UnsetType] = UNSET
+    signature_valid: Union[bool, UnsetType] = UNSET
+    spec_compatible: Union[bool, UnsetType] = UNSET
+    run_id: Union[str, UnsetType] = UNSET
+    run_fingerprint: Union[str, UnsetType] = UNSET
+    recomputed_fingerprint: Union[str, UnsetType] = UNSET
+    audit_root: Union[str, UnsetType] = UNSET
+
+
+class RunWithEvents(Run, frozen=True, gc=False):
+    """A newly created run with its first events inlined (POST /runs?include=events)"""
+
+    events: Optional[List[Event]] = None
+
+    def split(self) -> Tuple[Run, Optional[List[Event]]]:
+        """Return the plain Run and the inlined events, like popping "events" from a dict"""
+        run = Run(**{name: getattr(self, name) for name in Run.__struct_fields__})
+        return run, self.events
+
+
+class EventList(_Model, frozen=True, gc=False):
+    """Response envelope of the run events endpoint"""
+
+    events: List[Event] = []
+
+
+class PackList(_Model, frozen=True, gc=False):
+    """Response envelope of the pack search endpoint"""
+
+    results: List[Pack] = []
+
+
+class FederationStatus(_Model, frozen=True, gc=False):
+    """Response envelope of the federation status endpoint"""
+
+    nodes: List[FederationNode] = []
+
+
+# Decoders are built once and reused; keyed by the client's decode_as names
+DECODERS: Dict[str, Callable[[bytes], Any]] = {
+    "run": msgspec.json.Decoder(Run).decode,
+    "run_with_events": msgspec.json.Decoder(RunWithEvents).decode,
+    "event": msgspec.json.Decoder(Event).decode,
+    "events": msgspec.json.Decoder(EventList).decode,
+    "packs": msgspec.json.Decoder(PackList).decode,
+    "federation": msgspec.json.Decoder(FederationStatus).decode,
+    "verification": msgspec.json.Decoder(VerificationResult).decode,
+}
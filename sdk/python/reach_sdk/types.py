@@ -4,12 +4,20 @@ Type definitions for the Reach SDK
 
 from typing import Any, Dict, List, Literal, Optional, TypedDict
 
+# Allowed values of the Literal fields below, for O(1) membership checks at runtime
+RUN_STATUSES = frozenset({"pending", "running", "completed", "failed", "cancelled"})
+TERMINAL_RUN_STATUSES = RUN_STATUSES - {"pending", "running"}
+NODE_STATUSES = frozenset({"active", "inactive", "quarantined"})
+REPRO_GRADES = frozenset({"A", "B", "C", "D", "F"})
+
 
 class ReachClientConfig(TypedDict, total=False):
     """Configuration for the Reach client"""
 
     base_url: str
     timeout: float
+    cache_size: int
+    use_structs: bool
 
 
 class Run(TypedDict):
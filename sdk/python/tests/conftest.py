@@ -0,0 +1,27 @@
+"""
+Shared fixtures for the Reach SDK tests
+"""
+
+import httpx
+import pytest
+
+from reach_sdk import ReachClient
+
+
+@pytest.fixture
+def make_client():
+    """Build ReachClients whose requests are answered by an httpx.MockTransport handler"""
+    clients = []
+
+    def make(handler, **kwargs):
+        client = ReachClient(**kwargs)
+        client._client.close()
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
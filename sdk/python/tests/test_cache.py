@@ -0,0 +1,148 @@
+"""
+Tests for reach_sdk.cache and response caching in the client
+"""
+
+import time
+
+import httpx
+import pytest
+
+from reach_sdk.cache import ResponseCache
+
+
+class Clock:
+    """Stand-in for time.monotonic that only moves when told to"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    return clock
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = ResponseCache()
+    cache.set("key", b"body", ttl=2.0)
+
+    clock.now += 1.9
+    assert cache.get("key") == b"body"
+
+    clock.now += 0.1
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_evicted(clock):
+    cache = ResponseCache(maxsize=2)
+    cache.set("a", b"1", ttl=10)
+    cache.set("b", b"2", ttl=10)
+    cache.get("a")
+
+    cache.set("c", b"3", ttl=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+
+
+@pytest.mark.parametrize(("maxsize", "ttl"), [(0, 10.0), (8, 0.0)], ids=["size-0", "ttl-0"])
+def test_disabled_cache_stores_nothing(maxsize, ttl):
+    cache = ResponseCache(maxsize=maxsize)
+    cache.set("key", b"body", ttl=ttl)
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+class CountingServer:
+    """MockTransport handler that serves fixed JSON bodies and counts requests per path"""
+
+    def __init__(self, bodies, headers=None):
+        self.bodies = bodies
+        self.headers = headers or {}
+        self.counts = {}
+
+    def __call__(self, request):
+        path = request.url.path
+        self.counts[path] = self.counts.get(path, 0) + 1
+        return httpx.Response(200, json=self.bodies[path], headers=self.headers)
+
+
+HEALTH = {"/health": {"status": "ok", "version": "1.0.0"}}
+
+
+def test_get_served_from_cache_until_ttl(make_client, clock):
+    server = CountingServer(HEALTH)
+    client = make_client(server)
+
+    assert client.health() == client.health() == HEALTH["/health"]
+    assert server.counts["/health"] == 1
+
+    clock.now += 2.0
+    client.health()
+    assert server.counts["/health"] == 2
+
+
+def test_cached_result_is_a_fresh_object(make_client, clock):
+    client = make_client(CountingServer(HEALTH))
+
+    client.health()["status"] = "mutated"
+
+    assert client.health()["status"] == "ok"
+
+
+def test_cache_size_zero_disables_caching(make_client, clock):
+    server = CountingServer(HEALTH)
+    client = make_client(server, cache_size=0)
+
+    client.health()
+    client.health()
+
+    assert server.counts["/health"] == 2
+
+
+def test_no_store_response_not_cached(make_client, clock):
+    server = CountingServer(HEALTH, headers={"Cache-Control": "private, No-Store"})
+    client = make_client(server)
+
+    client.health()
+    client.health()
+
+    assert server.counts["/health"] == 2
+
+
+@pytest.mark.parametrize(
+    ("status", "requests"),
+    [("running", 2), ("pending", 2), ("completed", 1), ("failed", 1), ("cancelled", 1)],
+)
+def test_only_terminal_runs_cached(make_client, clock, status, requests):
+    run = {"id": "run-1", "status": status, "created_at": "2024-01-01T00:00:00Z"}
+    server = CountingServer({"/runs/run-1": run})
+    client = make_client(server)
+
+    client.get_run("run-1")
+    client.get_run("run-1")
+
+    assert server.counts["/runs/run-1"] == requests
+
+
+def test_search_cached_per_query(make_client, clock):
+    queries = []
+
+    def handler(request):
+        queries.append(request.url.params.get("q"))
+        return httpx.Response(200, json={"results": []})
+
+    client = make_client(handler)
+
+    for query in ["demo", "demo", "other", None, None]:
+        client.search_packs(query=query)
+
+    assert queries == ["demo", "other", None]
@@ -0,0 +1,113 @@
+"""
+Tests for ReachClient request handling
+"""
+
+from importlib.util import find_spec
+
+import httpx
+import pytest
+
+from reach_sdk.exceptions import ReachAPIError, ReachError
+
+STRUCT_MODES = [
+    False,
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(find_spec("msgspec") is None, reason="requires msgspec"),
+    ),
+]
+
+
+@pytest.mark.parametrize("use_structs", STRUCT_MODES, ids=["dicts", "structs"])
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda client: client.get_run_events("run-1"),
+        lambda client: client.search_packs(),
+        lambda client: client.get_federation_status(),
+    ],
+    ids=["events", "packs", "federation"],
+)
+def test_envelope_endpoint_without_body(make_client, use_structs, call):
+    client = make_client(lambda request: httpx.Response(204), use_structs=use_structs)
+
+    with pytest.raises(ReachError) as excinfo:
+        call(client)
+
+    assert excinfo.value.code == "INVALID_RESPONSE"
+
+
+def test_invalid_success_body(make_client):
+    client = make_client(lambda request: httpx.Response(200, content=b"<html>"))
+
+    with pytest.raises(ReachError) as excinfo:
+        client.version()
+
+    assert not isinstance(excinfo.value, ReachAPIError)
+    assert excinfo.value.code == "INVALID_RESPONSE"
+
+
+def test_json_error_body(make_client):
+    body = {
+        "error": "Run not found",
+        "code": "RUN_NOT_FOUND",
+        "details": {"run_id": "run-1"},
+        "remediation": "Check the run ID",
+    }
+    client = make_client(lambda request: httpx.Response(404, json=body))
+
+    with pytest.raises(ReachAPIError) as excinfo:
+        client.get_run("run-1")
+
+    error = excinfo.value
+    assert error.status_code == 404
+    assert error.message == "Run not found"
+    assert error.code == "RUN_NOT_FOUND"
+    assert error.details == {"run_id": "run-1"}
+    assert error.remediation == "Check the run ID"
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        httpx.Response(502, content=b"Bad Gateway"),
+        httpx.Response(500, json=["not", "an", "object"]),
+        httpx.Response(503),
+    ],
+    ids=["text", "non-object", "empty"],
+)
+def test_non_json_error_body(make_client, response):
+    client = make_client(lambda request: response)
+
+    with pytest.raises(ReachAPIError) as excinfo:
+        client.health()
+
+    error = excinfo.value
+    assert error.status_code == response.status_code
+    assert error.code == "HTTP_ERROR"
+    assert error.message == f"HTTP {response.status_code}"
+
+
+@pytest.mark.parametrize(
+    ("call", "target"),
+    [
+        (lambda client: client.get_run("a/b"), b"/runs/a%2Fb"),
+        (lambda client: client.get_run_events("a/b"), b"/runs/a%2Fb/events"),
+        (lambda client: client.get_run_events("a/b", after=7), b"/runs/a%2Fb/events?after=7"),
+        (lambda client: client.get_run_events("r", after=0), b"/runs/r/events?after=0"),
+        (lambda client: client.replay_run("a b?"), b"/runs/a%20b%3F/replay"),
+        (lambda client: client.search_packs(), b"/packs"),
+        (lambda client: client.search_packs(query="x&y z"), b"/packs?q=x%26y+z"),
+    ],
+    ids=["run", "events", "events-after", "events-after-zero", "replay", "packs", "packs-query"],
+)
+def test_request_target(make_client, call, target):
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.raw_path)
+        return httpx.Response(200, json={"id": "a/b", "status": "running", "events": []})
+
+    call(make_client(handler))
+
+    assert seen == [target]
@@ -0,0 +1,71 @@
+"""
+Tests for reach_sdk.codec
+"""
+
+import dataclasses
+import datetime
+import enum
+import uuid
+
+import pytest
+
+from reach_sdk import ReachClient
+from reach_sdk.codec import _json_dumps, encode_body, loads, parse_body
+from reach_sdk.exceptions import ReachError
+
+
+class Tier(enum.Enum):
+    PRO = "pro"
+
+
+@dataclasses.dataclass
+class Window:
+    start: datetime.date
+    label: str
+
+
+BODY = {
+    "at": datetime.datetime(2024, 5, 1, 12, 30, 15, 250, tzinfo=datetime.timezone.utc),
+    "naive": datetime.datetime(2024, 5, 1, 12, 30),
+    "day": datetime.date(2024, 5, 1),
+    "time": datetime.time(8, 15),
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "tier": Tier.PRO,
+    "window": Window(datetime.date(2024, 1, 1), "q1"),
+    "text": "héllo",
+}
+
+
+def test_stdlib_fallback_matches_orjson():
+    orjson = pytest.importorskip("orjson")
+
+    assert _json_dumps(BODY) == orjson.dumps(BODY)
+
+
+@pytest.mark.parametrize("encode", [_json_dumps, encode_body], ids=["stdlib", "default"])
+def test_unsupported_type_rejected(encode):
+    with pytest.raises((TypeError, ReachError)):
+        encode({"x": {1, 2}})
+
+
+def test_encode_body_wraps_errors():
+    with pytest.raises(ReachError) as excinfo:
+        encode_body({"x": object()})
+
+    assert excinfo.value.code == "INVALID_REQUEST"
+    assert isinstance(excinfo.value.__cause__, TypeError)
+
+
+def test_parse_body_wraps_errors():
+    with pytest.raises(ReachError) as excinfo:
+        parse_body(loads, b"{not json")
+
+    assert excinfo.value.code == "INVALID_RESPONSE"
+    assert isinstance(excinfo.value.__cause__, ValueError)
+
+
+def test_create_run_rejects_unserializable_field():
+    with ReachClient() as client, pytest.raises(ReachError) as excinfo:
+        client.create_run(x={1, 2})
+
+    assert excinfo.value.code == "INVALID_REQUEST"
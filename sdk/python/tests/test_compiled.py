@@ -0,0 +1,19 @@
+"""
+Checks run against a wheel built with the mypyc hook (REACH_SDK_COMPILED=1)
+"""
+
+import os
+
+import pytest
+
+from reach_sdk import cache, codec
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("REACH_SDK_COMPILED"), reason="only meaningful for the compiled wheel"
+)
+
+
+@pytest.mark.parametrize("module", [codec, cache], ids=lambda m: m.__name__)
+def test_compiled_module_loaded(module):
+    # Guards against the suite silently importing the pure-Python sources instead
+    assert not module.__file__.endswith(".py"), module.__file__
@@ -0,0 +1,158 @@
+"""
+Tests for create_and_watch against servers with and without inlined events
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from reach_sdk import AsyncReachClient, ReachClient
+from reach_sdk.base import FUSED_CREATE_SUPPORT
+from reach_sdk.exceptions import ReachAPIError
+
+RUN = {"id": "run-1", "status": "pending", "created_at": "2024-01-01T00:00:00Z"}
+EVENTS = [
+    {"id": i, "type": "log", "payload": {}, "created_at": "2024-01-01T00:00:00Z"} for i in range(10)
+]
+
+
+class FakeServer:
+    """
+    Mock transport handler for POST /runs and GET /runs/{id}/events
+
+    mode is "supported" (inlines events), "ignored" (drops include=events),
+    "rejected" (answers include=events with 400) or "failing" (answers with 500).
+    """
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.requests = []
+
+    def __call__(self, request):
+        include = request.url.params.get("include")
+        self.requests.append((request.method, request.url.path, include))
+        if request.method == "GET" and request.url.path == "/runs/run-1/events":
+            return httpx.Response(200, json={"events": EVENTS})
+        if request.method != "POST" or request.url.path != "/runs":
+            return httpx.Response(404, json={"error": "not found", "code": "NOT_FOUND"})
+        if self.mode == "failing":
+            return httpx.Response(500, json={"error": "boom", "code": "INTERNAL"})
+        if include and self.mode == "rejected":
+            return httpx.Response(400, json={"error": "unknown parameter", "code": "BAD_REQUEST"})
+        if include and self.mode == "supported":
+            max_events = int(request.url.params["max_events"])
+            return httpx.Response(201, json={**RUN, "events": EVENTS[:max_events]})
+        return httpx.Response(201, json=RUN)
+
+
+@pytest.fixture(autouse=True)
+def reset_support():
+    FUSED_CREATE_SUPPORT.clear()
+    yield
+    FUSED_CREATE_SUPPORT.clear()
+
+
+def sync_client(server, use_structs=False):
+    client = ReachClient(base_url=f"http://{server.mode}", use_structs=use_structs)
+    client._client.close()
+    client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(server))
+    return client
+
+
+def create_and_watch_sync(server, use_structs=False, **kwargs):
+    with sync_client(server, use_structs) as client:
+        return client.create_and_watch(**kwargs)
+
+
+def create_and_watch_async(server, use_structs=False, **kwargs):
+    async def run():
+        client = AsyncReachClient(base_url=f"http://{server.mode}", use_structs=use_structs)
+        await client._client.aclose()
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(server)
+        )
+        async with client:
+            return await client.create_and_watch(**kwargs)
+
+    return asyncio.run(run())
+
+
+CLIENTS = pytest.mark.parametrize(
+    "create_and_watch", [create_and_watch_sync, create_and_watch_async], ids=["sync", "async"]
+)
+
+
+@CLIENTS
+def test_supported_single_request(create_and_watch):
+    server = FakeServer("supported")
+
+    run, events = create_and_watch(server, plan_tier="free", initial_events=3)
+
+    assert run == RUN
+    assert events == EVENTS[:3]
+    assert server.requests == [("POST", "/runs", "events")]
+    assert FUSED_CREATE_SUPPORT["http://supported"] is True
+
+
+@CLIENTS
+def test_ignored_reuses_created_run(create_and_watch):
+    server = FakeServer("ignored")
+
+    run, events = create_and_watch(server, initial_events=4)
+
+    assert run == RUN
+    assert events == EVENTS[:4]
+    assert server.requests == [("POST", "/runs", "events"), ("GET", "/runs/run-1/events", None)]
+    assert FUSED_CREATE_SUPPORT["http://ignored"] is False
+
+
+@CLIENTS
+def test_rejected_falls_back_to_plain_create(create_and_watch):
+    server = FakeServer("rejected")
+
+    run, events = create_and_watch(server, initial_events=5)
+
+    assert run == RUN
+    assert events == EVENTS[:5]
+    assert server.requests == [
+        ("POST", "/runs", "events"),
+        ("POST", "/runs", None),
+        ("GET", "/runs/run-1/events", None),
+    ]
+    assert FUSED_CREATE_SUPPORT["http://rejected"] is False
+
+
+@CLIENTS
+def test_unsupported_server_skips_include(create_and_watch):
+    server = FakeServer("rejected")
+    FUSED_CREATE_SUPPORT["http://rejected"] = False
+
+    create_and_watch(server, initial_events=5)
+
+    assert server.requests == [("POST", "/runs", None), ("GET", "/runs/run-1/events", None)]
+
+
+@CLIENTS
+@pytest.mark.parametrize("mode", ["supported", "ignored", "rejected"])
+def test_struct_mode_returns_plain_run(create_and_watch, mode):
+    models = pytest.importorskip("reach_sdk.models")
+
+    run, events = create_and_watch(FakeServer(mode), use_structs=True, initial_events=2)
+
+    assert type(run) is models.Run
+    assert "events" not in run
+    assert (run["id"], run["status"]) == ("run-1", "pending")
+    assert all(type(event) is models.Event for event in events)
+    assert [event.to_dict() for event in events] == EVENTS[:2]
+
+
+def test_other_errors_propagate():
+    server = FakeServer("failing")
+
+    with pytest.raises(ReachAPIError) as excinfo:
+        create_and_watch_sync(server)
+
+    assert excinfo.value.status_code == 500
+    assert server.requests == [("POST", "/runs", "events")]
+    assert "http://failing" not in FUSED_CREATE_SUPPORT
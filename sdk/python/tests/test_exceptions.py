@@ -0,0 +1,59 @@
+"""
+Tests for reach_sdk.exceptions
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from reach_sdk.exceptions import (
+    ReachAPIError,
+    ReachError,
+    ReachNetworkError,
+    ReachTimeoutError,
+)
+
+ERRORS = [
+    ReachError("bad body", code="INVALID_RESPONSE", details={"a": 1}, remediation="retry"),
+    ReachAPIError("nope", code="NOT_FOUND", status_code=404, remediation="check the id"),
+    ReachTimeoutError("slow"),
+    ReachNetworkError("down"),
+]
+
+
+@pytest.mark.parametrize("error", ERRORS, ids=lambda e: type(e).__name__)
+@pytest.mark.parametrize(
+    "roundtrip",
+    [lambda e: pickle.loads(pickle.dumps(e)), copy.copy, copy.deepcopy],
+    ids=["pickle", "copy", "deepcopy"],
+)
+def test_roundtrip_preserves_fields(error, roundtrip):
+    restored = roundtrip(error)
+
+    assert type(restored) is type(error)
+    assert restored.args == error.args
+    assert restored.message == error.message
+    assert restored.code == error.code
+    assert restored.details == error.details
+    assert restored.remediation == error.remediation
+    assert str(restored) == str(error)
+
+
+def test_roundtrip_preserves_status_code():
+    error = ReachAPIError("boom", code="HTTP_ERROR", status_code=503)
+
+    assert pickle.loads(pickle.dumps(error)).status_code == 503
+
+
+def test_roundtrip_preserves_subclass_attributes():
+    class CustomError(ReachError):
+        pass
+
+    error = CustomError("m", code="C")
+    error.extra = "kept"
+
+    restored = copy.copy(error)
+
+    assert restored.code == "C"
+    assert restored.extra == "kept"
@@ -0,0 +1,39 @@
+"""
+Tests for reach_sdk.models
+"""
+
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+
+from reach_sdk.models import DECODERS  # noqa: E402
+
+
+def test_missing_federation_fields_behave_like_missing_keys():
+    node = DECODERS["federation"](b'{"nodes": [{"node_id": "n1", "latency_ms": 12}]}').nodes[0]
+
+    assert node["node_id"] == "n1"
+    assert node.get("latency_ms") == 12
+    assert "status" not in node
+    assert node.get("status") is None
+    assert node.get("trust_score", 1.0) == 1.0
+    with pytest.raises(KeyError):
+        node["status"]
+    assert node.to_dict() == {"node_id": "n1", "latency_ms": 12}
+
+
+def test_missing_verification_fields_behave_like_missing_keys():
+    result = DECODERS["verification"](b'{"verified": true, "name": "pack"}')
+
+    assert result["verified"] is True
+    assert "run_id" not in result
+    assert result.to_dict() == {"verified": True, "name": "pack"}
+
+
+def test_explicit_null_is_distinct_from_missing():
+    run = DECODERS["run"](b'{"id": "r1", "status": "running", "created_at": "t", "tier": null}')
+
+    assert "tier" in run
+    assert run["tier"] is None
+    with pytest.raises(KeyError):
+        run["not_a_field"]
@@ -0,0 +1,69 @@
+"""
+Tests for the Server-Sent Events scanner in reach_sdk.codec
+"""
+
+import httpx
+
+from reach_sdk.codec import feed_sse
+
+
+def feed_all(chunks):
+    buffer = bytearray()
+    events = [event for chunk in chunks for event in feed_sse(buffer, chunk)]
+    return events, buffer
+
+
+def test_data_line_split_across_chunks():
+    events, buffer = feed_all([b'data: {"id"', b': 1, "ty', b'pe": "log"}\n'])
+
+    assert events == [{"id": 1, "type": "log"}]
+    assert buffer == b""
+
+
+def test_multiple_frames_in_one_chunk():
+    events, _ = feed_all([b'data: {"id": 1}\n\ndata: {"id": 2}\n\n'])
+
+    assert events == [{"id": 1}, {"id": 2}]
+
+
+def test_crlf_frames():
+    events, buffer = feed_all([b'data: {"id": 1}\r\n\r\ndata: {"id": 2}\r', b"\n\r\n"])
+
+    assert events == [{"id": 1}, {"id": 2}]
+    assert buffer == b""
+
+
+def test_non_data_lines_skipped():
+    chunk = b': keep-alive\nevent: log\nid: 7\nretry: 1000\ndata: {"id": 1}\n\n'
+
+    events, _ = feed_all([chunk])
+
+    assert events == [{"id": 1}]
+
+
+def test_invalid_json_frames_skipped():
+    events, _ = feed_all([b"data: {not json\n", b'data: {"id": 2}\n'])
+
+    assert events == [{"id": 2}]
+
+
+def test_trailing_partial_line_stays_buffered():
+    events, buffer = feed_all([b'data: {"id": 1}\ndata: {"id"'])
+
+    assert events == [{"id": 1}]
+    assert buffer == b'data: {"id"'
+
+    assert list(feed_sse(buffer, b": 2}\n")) == [{"id": 2}]
+    assert buffer == b""
+
+
+def test_stream_run_events(make_client):
+    chunks = [b'data: {"id": 1, "type": "log"}\n\nda', b'ta: {"id": 2, "type": "done"}\n\n']
+
+    def handler(request):
+        assert request.headers["Accept"] == "text/event-stream"
+        return httpx.Response(200, content=iter(chunks))
+
+    client = make_client(handler)
+
+    assert [event["id"] for event in client.stream_run_events("run-1")] == [1, 2]